@@ -8,7 +8,7 @@ import sys
 import json
 from random import normalvariate
 from multiprocessing import JoinableQueue as Queue
-from .cfg import PLENGTH, DIGILEN, AU2KCAL, WARNLEN, CODING, NmrRef, qm_prepinfo
+from .cfg import PLENGTH, DIGILEN, AU2KCAL, WARNLEN, CODING, qm_prepinfo
 from .parallel import run_in_parallel
 from .orca_job import OrcaJob
 from .tm_job import TmJob
@@ -25,6 +25,79 @@ from .utilities import (
 )
 
 
+# functional names used in the reference shielding tables
+RELAY_NAMES_FUNC_S = {
+    "r2scan-3c": "r2scan-3c",
+    "pbeh-3c": "pbeh-3c",
+    "b97-3c": "b97-3c",
+    "tpss-d3": "tpss",
+    "tpss-d4": "tpss",
+    "tpss-novdw": "tpss",
+    "tpss-d3(0)": "tpss",
+    "kt2-novdw": "kt2",
+    "pbe0-novdw": "pbe0",
+    "pbe0-d3": "pbe0",
+    "pbe0-d3(0)": "pbe0",
+    "pbe0-d4": "pbe0",
+    "wb97x-d3": "wb97x",
+    "dsd-blyp-d3": "dsd-blyp",
+}
+RELAY_NAMES_FUNC = {
+    "tpss-d3": "tpss",
+    "r2scan-3c": "r2scan-3c",
+    "pbeh-3c": "pbeh-3c",
+    "b97-3c": "b97-3c",
+}
+
+
+# atomic number, reference shielding tables (attributes of NmrRef) and default
+# reference molecule of the elements written to .anmrrc
+ANMR_ELEMENTS = {
+    "h": {
+        "atomic_number": 1,
+        "tm": "h_tm_shieldings",
+        "orca": "h_orca_shieldings",
+        "adf": "h_adf_shieldings",
+        "ref_mol": "TMS",
+    },
+    "c": {
+        "atomic_number": 6,
+        "tm": "c_tm_shieldings",
+        "orca": "c_orca_shieldings",
+        "adf": "c_adf_shieldings",
+        "ref_mol": "TMS",
+    },
+    "f": {
+        "atomic_number": 9,
+        "tm": "f_tm_shieldings",
+        "orca": "f_orca_shieldings",
+        "adf": "f_adf_shieldings",
+        "ref_mol": "CFCl3",
+    },
+    "si": {
+        "atomic_number": 14,
+        "tm": "si_tm_shieldings",
+        "orca": "si_orca_shieldings",
+        "adf": "si_adf_shieldings",
+        "ref_mol": "TMS",
+    },
+    "p": {
+        "atomic_number": 15,
+        "tm": "p_tm_shieldings",
+        "orca": "p_orca_shieldings",
+        "adf": "p_adf_shieldings",
+        "ref_mol": "TMP",
+    },
+}
+
+# element row of .anmrrc: atomic number, reference shielding, 0.0, active
+ANMRRC_ROW = "{:3}  {}    0.0     {}\n"
+# J= and S= settings of .anmrrc, indexed by bool
+ONOFF = ("off", "on")
+# solvation model (keyword, name) of the reference calculations for each program
+REF_SOLVATION = {"tm": ("dcosmors", "DCOSMO-RS"), "orca": ("smd", "SMD")}
+
+
 def read_chemeq(path):
     """read chemeq from anmr_nucinfo"""
     with open(path, "r") as inp:
@@ -86,16 +159,21 @@ def average_shieldings(config, calculate, element_ref_shield, energy, solv, rrho
         sigma_std_dev[i] = []
         sigma_std_dev_const[i] = []
 
+    # shielding constants averaged over the chemically equivalent atoms,
+    # these do not change during the sampling of the free energies below
+    eq_sigma = {}
     for conf in calculate:
         # get averaged shielding constants
         if not element:
             element = get_atom(
                 os.path.normpath(os.path.join(config.cwd, "CONF" + str(conf.id), "NMR"))
             )
+        eq_sigma[conf.id] = {}
         for atom in conf.shieldings.keys():
             sigma = sum(
                 [conf.shieldings.get(eq_atom, 0.0) for eq_atom in chemeq[atom]]
             ) / len(chemeq[atom])
+            eq_sigma[conf.id][atom] = sigma
             averaged[atom] = conf.bm_weight * sigma + averaged.get(atom, 0.0)
     # get SD on shieldings based on SD Gsolv
     if solv is not None:
@@ -121,10 +199,7 @@ def average_shieldings(config, calculate, element_ref_shield, energy, solv, rrho
             for i in range(1, config.nat + 1):
                 tmp_sigma[i] = 0
             for conf in calculate:
-                for atom in conf.shieldings.keys():
-                    sigma = sum(
-                        [conf.shieldings.get(eq_atom, 0.0) for eq_atom in chemeq[atom]]
-                    ) / len(chemeq[atom])
+                for atom, sigma in eq_sigma[conf.id].items():
                     tmp_sigma[atom] += conf.bm_weight * sigma
             for atom in conf.shieldings.keys():
                 sigma_std_dev[atom].append(tmp_sigma[atom])
@@ -148,10 +223,7 @@ def average_shieldings(config, calculate, element_ref_shield, energy, solv, rrho
             for i in range(1, config.nat + 1):
                 tmp_sigma[i] = 0
             for conf in calculate:
-                for atom in conf.shieldings.keys():
-                    sigma = sum(
-                        [conf.shieldings.get(eq_atom, 0.0) for eq_atom in chemeq[atom]]
-                    ) / len(chemeq[atom])
+                for atom, sigma in eq_sigma[conf.id].items():
                     tmp_sigma[atom] += conf.bm_weight * sigma
             for atom in conf.shieldings.keys():
                 sigma_std_dev_const[atom].append(tmp_sigma[atom])
@@ -163,9 +235,7 @@ def average_shieldings(config, calculate, element_ref_shield, energy, solv, rrho
         line = "".ljust(int(105), "-")
         print(line)
         out.write(line + "\n")
-        maxsigma = (
-            max([len(str(sigma).split(".")[0]) for sigma in averaged.values()]) + 5
-        )
+        maxsigma = max(len(str(sigma).split(".")[0]) for sigma in averaged.values()) + 5
         make_shift = (
             lambda atom: f"{-sigma+element_ref_shield.get(element[atom], 0.0):> {maxsigma}.2f}"
             if (element_ref_shield.get(element[atom], None) is not None)
@@ -212,20 +282,21 @@ def average_shieldings(config, calculate, element_ref_shield, energy, solv, rrho
     print(line)
     line = "".ljust(int(105), "-")
     print(line)
+    lenconfx = max(len(str(conf.id)) for conf in calculate) + 5
     for atom in conf.shieldings.keys():
         try:
-            minx = min(list(atom_sigma[atom].values()))
+            minx = min(atom_sigma[atom].values())
             minid = next(
                 key for key, value in atom_sigma[atom].items() if value == minx
             )
-            maxx = max(list(atom_sigma[atom].values()))
+            maxx = max(atom_sigma[atom].values())
             maxid = next(
                 key for key, value in atom_sigma[atom].items() if value == maxx
             )
             line = (
                 f"{atom:< {10}}  {element[atom]:^{7}}  {averaged[atom]:> {maxsigma}.2f}  "
-                + f"{minx :> {maxsigma}.2f} {'CONF'+str(minid):<{max([len(str(conf.id)) for conf in calculate])+5}}  {maxx :> {maxsigma}.2f} "
-                + f"{'CONF'+str(maxid):<{max([len(str(conf.id)) for conf in calculate])+5}}  {maxx-minx:> {maxsigma}.2f}"
+                + f"{minx :> {maxsigma}.2f} {'CONF'+str(minid):<{lenconfx}}  {maxx :> {maxsigma}.2f} "
+                + f"{'CONF'+str(maxid):<{lenconfx}}  {maxx-minx:> {maxsigma}.2f}"
             )
             print(line)
         except Exception:
@@ -242,51 +313,13 @@ def write_anmrrc(config):
 
     # get absolute shielding constant of reference
     ref_decision = {
-        "h": {
-            "atomic_number": 1,
-            "sigma": 0.0,
-            "tm": "h_tm_shieldings",
-            "orca": "h_orca_shieldings",
-            "adf": "h_adf_shieldings",
-            "ref_mol": getattr(config, "h_ref", "TMS"),
-            "active": getattr(config, "h_active", False),
-        },
-        "c": {
-            "atomic_number": 6,
-            "sigma": 0.0,
-            "tm": "c_tm_shieldings",
-            "orca": "c_orca_shieldings",
-            "adf": "c_adf_shieldings",
-            "ref_mol": getattr(config, "c_ref", "TMS"),
-            "active": getattr(config, "c_active", False),
-        },
-        "f": {
-            "atomic_number": 9,
-            "sigma": 0.0,
-            "tm": "f_tm_shieldings",
-            "orca": "f_orca_shieldings",
-            "adf": "f_adf_shieldings",
-            "ref_mol": getattr(config, "f_ref", "CFCl3"),
-            "active": getattr(config, "f_active", False),
-        },
-        "si": {
-            "atomic_number": 14,
-            "sigma": 0.0,
-            "tm": "si_tm_shieldings",
-            "orca": "si_orca_shieldings",
-            "adf": "si_adf_shieldings",
-            "ref_mol": getattr(config, "si_ref", "TMS"),
-            "active": getattr(config, "si_active", False),
-        },
-        "p": {
-            "atomic_number": 15,
-            "sigma": 0.0,
-            "tm": "p_tm_shieldings",
-            "orca": "p_orca_shieldings",
-            "adf": "p_adf_shieldings",
-            "ref_mol": getattr(config, "p_ref", "TMP"),
-            "active": getattr(config, "p_active", False),
-        },
+        element: dict(
+            info,
+            sigma="0.000",
+            ref_mol=getattr(config, element + "_ref", info["ref_mol"]),
+            active=getattr(config, element + "_active", False),
+        )
+        for element, info in ANMR_ELEMENTS.items()
     }
     # if non are active set all active
     if all(
@@ -299,43 +332,24 @@ def write_anmrrc(config):
             ref_decision[element]["active"] = True
 
     refwarnings = []
-
+    refbasisS = "def2-TZVP"
     if config.solvent != "gas":
         # optimization in solvent:
-        if config.prog == "tm" and config.sm2 != "dcosmors":
+        sm2, refsm2 = REF_SOLVATION[config.prog]
+        if config.sm2 != sm2:
             refwarnings.append(
                 f"{'WARNING:':{WARNLEN}}The geometry optimization of the reference molecule "
-                "was calculated with DCOSMO-RS (sm2)!"
+                f"was calculated with {refsm2} (sm2)!"
             )
-        elif config.prog == "orca" and config.sm2 != "smd":
+        sm4, refsm4 = REF_SOLVATION[config.prog4_s]
+        if config.sm4_s != sm4:
             refwarnings.append(
-                f"{'WARNING:':{WARNLEN}}The geometry optimization of the reference molecule "
-                "was calculated with SMD (sm2)!"
+                f"{'WARNING:':{WARNLEN}}The reference shielding constant was calculated with "
+                f"{refsm4} (sm4_s)!"
             )
-        if config.prog == "tm":
-            refsm2 = "DCOSMO-RS"
-        elif config.prog == "orca":
-            refsm2 = "SMD"
-        if config.prog4_s == "tm":
-            refsm4 = "DCOSMO-RS"
-            refbasisS = "def2-TZVP"
-            if config.sm4_s != "dcosmors":
-                refwarnings.append(
-                    f"{'WARNING:':{WARNLEN}}The reference shielding constant was calculated with "
-                    "DCOSMORS (sm4_s)!"
-                )
-        elif config.prog4_s == "orca":
-            refsm4 = "SMD"
-            refbasisS = "def2-TZVP"
-            if config.sm4_s != "smd":
-                refwarnings.append(
-                    f"{'WARNING:':{WARNLEN}}The reference shielding constant was calculated with "
-                    "SMD (sm4_s)!"
-                )
     else:
         refsm2 = ""
         refsm4 = ""
-        refbasisS = "def2-TZVP"
     if config.basis_s != "def2-TZVP":
         refwarnings.append(
             f"{'WARNING:':{WARNLEN}}The reference shielding constant was calculated with the "
@@ -354,9 +368,12 @@ def write_anmrrc(config):
             print(line)
 
     # read NMR_references
+    from .nmrref import NmrRef
+
     nmr_ref_user_path = os.path.expanduser(
         os.path.join("~/.censo_assets/", "censo_nmr_ref.json")
     )
+    tmp_ref = {}
     if os.path.isfile(nmr_ref_user_path):
         try:
             with open(nmr_ref_user_path, "r", encoding=CODING, newline=None) as inp:
@@ -369,105 +386,74 @@ def write_anmrrc(config):
     nmrref = NmrRef().dict_to_NMRRef(tmp_ref)
     # end reading NMR_references
 
-    relay_names_func_s = {
-        "r2scan-3c": "r2scan-3c",
-        "pbeh-3c": "pbeh-3c",
-        "b97-3c": "b97-3c",
-        "tpss-d3": "tpss",
-        "tpss-d4": "tpss",
-        "tpss-novdw": "tpss",
-        "tpss-d3(0)": "tpss",
-        "kt2-novdw": "kt2",
-        "pbe0-novdw": "pbe0",
-        "pbe0-d3": "pbe0",
-        "pbe0-d3(0)": "pbe0",
-        "pbe0-d4": "pbe0",
-        "wb97x-d3": "wb97x",
-        "dsd-blyp-d3": "dsd-blyp",
-    }
-    tmp_func_s = relay_names_func_s.get(config.func_s, config.func_s)
-    relay_names_func = {
-        "tpss-d3": "tpss",
-        "r2scan-3c": "r2scan-3c",
-        "pbeh-3c": "pbeh-3c",
-        "b97-3c": "b97-3c",
-    }
-    tmp_func = relay_names_func.get(config.func, config.func)
+    tmp_func_s = RELAY_NAMES_FUNC_S.get(config.func_s, config.func_s)
+    tmp_func = RELAY_NAMES_FUNC.get(config.func, config.func)
+    # key of the reference shielding without the reference molecule
+    prog4_s = config.prog4_s
+    method = (tmp_func, tmp_func_s, config.basis_s, config.solvent)
+    fallback_method = (tmp_func, "pbe0", "def2-TZVP", config.solvent)
 
     for element, value in ref_decision.items():
         if value.get("active", False):
             # if getattr(nmrref, ref_decision[element].get(config.prog4_s))[
             #             ref_decision[element]["ref_mol"]].get(tmp_func, "not_calc")
             #             == "not_calc":
-            try:
-                ref_decision[element]["sigma"] = "{:4.3f}".format(
-                    getattr(nmrref, ref_decision[element].get(config.prog4_s))[
-                        ref_decision[element]["ref_mol"]
-                    ][tmp_func][tmp_func_s][config.basis_s][config.solvent]
-                )
-            except KeyError as e:
-                try:
-                    ref_decision[element]["sigma"] = "{:4.3f}".format(
-                        getattr(nmrref, ref_decision[element].get(config.prog4_s))[
-                            ref_decision[element]["ref_mol"]
-                        ][tmp_func].get("pbe0")["def2-TZVP"][config.solvent]
-                    )
+            table = value.get(prog4_s)
+            key = (value["ref_mol"],) + method
+            sigma = nmrref.get_shielding(table, key)
+            if sigma is None:
+                fallback = (value["ref_mol"],) + fallback_method
+                sigma = nmrref.get_shielding(table, fallback)
+                if sigma is not None:
                     print(
                         f"{'WARNING:':{WARNLEN}}The reference absolute shielding constant "
                         f"for {config.func_s}/{config.basis_s} and element {element:3} could "
                         f"not be found, using {'pbe0/def2-TZVP'} reference instead!"
                     )
-                    print(f"{'INFORMATION:':{WARNLEN}}The KeyError is: {e}")
-                except KeyError as e:
+                    print(f"{'INFORMATION:':{WARNLEN}}The missing entry is: {key}")
+                else:
                     print(
                         f"{'ERROR:':{WARNLEN}}The reference absolute shielding constant for "
                         f"element {element} could not be found!\n"
                         f"{'':{WARNLEN}}You have to edit the file .anmrrc by hand!"
                     )
-                    print(f"{'INFORMATION:':{WARNLEN}}The KeyError is: {e}")
-                    ref_decision[element]["sigma"] = f"{0.0 :4.3f}"
+                    print(f"{'INFORMATION:':{WARNLEN}}The missing entry is: {fallback}")
+                    sigma = 0.0
+            value["sigma"] = "{:4.3f}".format(sigma)
 
-    # for elementactive
-    exch = {True: 1, False: 0}
-    exchonoff = {True: "on", False: "off"}
     # write .anmrrc
-    with open(os.path.join(config.cwd, ".anmrrc"), "w", newline=None) as arc:
-        arc.write("7 8 XH acid atoms\n")
-        if config.resonance_frequency is not None:
-            arc.write(
-                "ENSO qm= {} mf= {} lw= 1.0  J= {} S= {} T= {:6.2f} \n".format(
-                    str(config.prog4_s).upper(),
-                    str(config.resonance_frequency),
-                    exchonoff[config.couplings],
-                    exchonoff[config.shieldings],
-                    float(config.temperature),
-                )
-            )
-        else:
-            arc.write("ENSO qm= {} lw= 1.2\n".format(str(config.prog4_s).upper()))
-        arc.write(
-            "{}[{}] {}[{}]/{}//{}[{}]/{}\n".format(
-                config.h_ref,
-                config.solvent,
-                config.func_s,
-                refsm4,
-                refbasisS,
-                config.func,
-                refsm2,
-                config.basis,
-            )
+    prog4 = str(config.prog4_s).upper()
+    lines = ["7 8 XH acid atoms\n"]
+    if config.resonance_frequency is not None:
+        lines.append(
+            f"ENSO qm= {prog4} mf= {config.resonance_frequency} lw= 1.0  "
+            f"J= {ONOFF[config.couplings]} S= {ONOFF[config.shieldings]} "
+            f"T= {float(config.temperature):6.2f} \n"
+        )
+    else:
+        lines.append(f"ENSO qm= {prog4} lw= 1.2\n")
+    lines.append(
+        "{}[{}] {}[{}]/{}//{}[{}]/{}\n".format(
+            config.h_ref,
+            config.solvent,
+            config.func_s,
+            refsm4,
+            refbasisS,
+            config.func,
+            refsm2,
+            config.basis,
         )
-        for element, value in ref_decision.items():
-            if value.get("active", False):
-                arc.write(
-                    f"{value.get('atomic_number'):3}  "
-                    f"{ref_decision[element]['sigma']}    {0.0}     "
-                    f"{exch[ref_decision[element]['active']]}\n"
+    )
+    for value in ref_decision.values():
+        if value.get("active", False):
+            lines.append(
+                ANMRRC_ROW.format(
+                    value["atomic_number"], value["sigma"], int(value["active"])
                 )
-    refs = {}
-    for key in ref_decision:
-        refs[key] = float(ref_decision[key]["sigma"])
-    return refs
+            )
+    with open(os.path.join(config.cwd, ".anmrrc"), "w", newline=None) as arc:
+        arc.write("".join(lines))
+    return {key: float(value["sigma"]) for key, value in ref_decision.items()}
 
 
 def part4(config, conformers, store_confs, ensembledata):
@@ -1256,25 +1242,21 @@ def part4(config, conformers, store_confs, ensembledata):
         )
     calculate = calc_boltzmannweights(calculate, "free_energy", config.temperature)
     try:
-        length = max([len(str(i.id)) for i in calculate]) + 1
+        length = max(len(str(i.id)) for i in calculate) + 1
         if int(length) < 4:
             length = 4
-        fmtenergy = max([len("{: .7f}".format(i.free_energy)) for i in calculate])
+        fmtenergy = max(len("{: .7f}".format(i.free_energy)) for i in calculate)
         if config.solvent != "gas":
             fmtsolv = max(
-                [
-                    len("{: .7f}".format(getattr(i, gsolv, {"energy": 0.0})["energy"]))
-                    for i in calculate
-                ]
+                len("{: .7f}".format(getattr(i, gsolv, {"energy": 0.0})["energy"]))
+                for i in calculate
             )
         else:
             fmtsolv = 10
         if config.evaluate_rrho:
             fmtrrho = max(
-                [
-                    len("{: .7f}".format(getattr(i, rrho, {"energy": 0.0})["energy"]))
-                    for i in calculate
-                ]
+                len("{: .7f}".format(getattr(i, rrho, {"energy": 0.0})["energy"]))
+                for i in calculate
             )
         else:
             fmtrrho = 10
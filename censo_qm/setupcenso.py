@@ -13,7 +13,6 @@ from .cfg import (
     WARNLEN,
     censo_solvent_db,
     __version__,
-    NmrRef,
     editable_ORCA_input,
 )
 from .inputhandling import config_setup, internal_settings
@@ -215,6 +214,8 @@ def enso_startup(cwd, args):
         os.path.join("~/.censo_assets/", "censo_nmr_ref.json")
     )
     if not os.path.isfile(nmr_ref_user_path):
+        from .nmrref import NmrRef
+
         try:
             with open(nmr_ref_user_path, "w") as out:
                 tmp = NmrRef()
@@ -9,10 +9,17 @@ import math
 import hashlib
 import time
 import subprocess
-from copy import deepcopy
+from concurrent.futures import ThreadPoolExecutor
 from builtins import print as print_orig
 from .cfg import ENVIRON, CODING, AU2J, AU2KCAL, BOHR2ANG, KB, WARNLEN
 
+# line templates of the coordinate converters, %-formatting is the cheapest
+# way to format the many numbers of large ensembles
+XYZ_LINE = "%-3s % .10f  % .10f  % .10f"  # element x y z in Angstrom
+COORD_LINE = "% .14f % .14f  % .14f  %s"  # x y z in Bohr element
+# characters a string accepted by float() can start with (incl. nan and inf)
+FLOAT_START = frozenset("+-.0123456789nNiI")
+
 
 def print(*args, **kwargs):
     """
@@ -36,25 +43,22 @@ def print(*args, **kwargs):
 
 def frange(start, end, step=1):
     """
-    range with floats
+    range with floats, values are calculated as start + count * step and
+    therefore do not accumulate rounding errors
     """
-    try:
-        start = float(start)
-        end = float(end)
-        step = float(step)
-    except (ValueError, TypeError):
-        raise
+    start = float(start)
+    end = float(end)
+    step = float(step)
+    if step <= 0.0:
+        raise ValueError(f"frange step has to be positive, not {step}!")
     if start > end:
-        tmp = start
-        start = end
-        end = tmp
-    count = 0
-    while True:
-        temp = float(start + count * step)
-        if temp >= end:
-            break
-        yield temp
-        count += 1
+        start, end = end, start
+    number = math.ceil((end - start) / step) + 1
+    values = [start + count * step for count in range(number)]
+    # drop values at or beyond end (at most two, depending on rounding)
+    while values and values[-1] >= end:
+        values.pop()
+    return values
 
 
 def mkdir_p(path):
@@ -80,21 +84,25 @@ def print_block(strlist, width=80, redirect=False):
         sys.stdout = result
     length = 0
     try:
-        maxlen = max([len(str(x)) for x in strlist])
+        maxlen = max(map(len, map(str, strlist)))
     except (ValueError, TypeError):
         maxlen = 12
-    for item in strlist:
+    last = len(strlist) - 1
+    block = []  # collect everything and print (and flush) only once
+    for i, item in enumerate(strlist):
         length += maxlen + 2
         if length <= width:
-            if not item == strlist[-1]:  # works only if item only once in list!
-                print("{:>{digits}}, ".format(str(item), digits=maxlen), end="")
+            if i != last:
+                block.append(f"{str(item):>{maxlen}}, ")
             else:
-                print("{:>{digits}}".format(str(item), digits=maxlen), end="")
+                block.append(f"{str(item):>{maxlen}}")
         else:
-            print("{:>{digits}}".format(str(item), digits=maxlen))
+            block.append(f"{str(item):>{maxlen}}\n")
             length = 0
     if length != 0:
-        print("\n")
+        block.append("\n\n")
+    if block:
+        print("".join(block), end="")
     if redirect:
         sys.stdout = old_stdout
         return result.getvalue()
@@ -120,23 +128,18 @@ def t2x(path, writexyz=False, outfile="original.xyz"):
             path = os.path.join(path, "coord")
     with open(path, "r", encoding=CODING, newline=None) as f:
         coord = f.readlines()
-    x = []
-    y = []
-    z = []
-    atom = []
+    coordxyz = []
     for line in coord[1:]:
         if "$" in line:  # stop at $end ...
             break
-        x.append(float(line.split()[0]) * BOHR2ANG)
-        y.append(float(line.split()[1]) * BOHR2ANG)
-        z.append(float(line.split()[2]) * BOHR2ANG)
-        atom.append(str(line.split()[3].lower()))
-    # natoms = int(len(coord[1:-1])) # unused
-    coordxyz = []
-    for i in range(len(x)):
+        x, y, z, atom = line.split(None, 4)[:4]
         coordxyz.append(
-            "{:3} {: .10f}  {: .10f}  {: .10f}".format(
-                atom[i][0].upper() + atom[i][1:], x[i], y[i], z[i]
+            XYZ_LINE
+            % (
+                atom.capitalize(),
+                float(x) * BOHR2ANG,
+                float(y) * BOHR2ANG,
+                float(z) * BOHR2ANG,
             )
         )
     if writexyz:
@@ -146,9 +149,7 @@ def t2x(path, writexyz=False, outfile="original.xyz"):
             encoding=CODING,
             newline=None,
         ) as out:
-            out.write(str(len(coordxyz)) + "\n\n")
-            for line in coordxyz:
-                out.write(line + "\n")
+            out.write(f"{len(coordxyz)}\n\n" + "\n".join(coordxyz) + "\n")
     return coordxyz, int(len(coordxyz))
 
 
@@ -158,25 +159,22 @@ def x2t(path, infile="inp.xyz"):
         path = os.path.join(path, infile)
     with open(path, "r", encoding=CODING, newline=None) as f:
         xyz = f.readlines()
-        atom = []
-        x = []
-        y = []
-        z = []
-        for line in xyz[2:]:
-            atom.append(str(line.split()[0].lower()))
-            x.append(float(line.split()[1]) / BOHR2ANG)
-            y.append(float(line.split()[2]) / BOHR2ANG)
-            z.append(float(line.split()[3]) / BOHR2ANG)
-        coordxyz = []
-        for i in range(len(x)):
-            coordxyz.append(f"{x[i]: .14f} {y[i]: .14f}  {z[i]: .14f}  {atom[i]}")
-        with open(
-            os.path.join(os.path.split(path)[0], "coord"), "w", newline=None
-        ) as coord:
-            coord.write("$coord\n")
-            for line in coordxyz:
-                coord.write(line + "\n")
-            coord.write("$end\n")
+    coordxyz = []
+    for line in xyz[2:]:
+        atom, x, y, z = line.split(None, 4)[:4]
+        coordxyz.append(
+            COORD_LINE
+            % (
+                float(x) / BOHR2ANG,
+                float(y) / BOHR2ANG,
+                float(z) / BOHR2ANG,
+                atom.lower(),
+            )
+        )
+    with open(
+        os.path.join(os.path.split(path)[0], "coord"), "w", newline=None
+    ) as coord:
+        coord.write("$coord\n" + "\n".join(coordxyz) + "\n$end\n")
 
 
 def write_trj(
@@ -211,11 +209,11 @@ def write_trj(
     except NameError:
         energy = None
     try:
-        with open(outpath, "a", encoding=CODING, newline=None) as out:
+        with open(
+            outpath, "a", encoding=CODING, newline=None, buffering=1048576
+        ) as out:
             for conf in results:
                 conf_xyz, nat = t2x(os.path.join(cwd, "CONF" + str(conf.id), optfolder))
-                ### coordinates in xyz
-                out.write("  {}\n".format(nat))
                 xtbfree = conf.calc_free_energy(
                     e=energy,
                     solv=None,
@@ -226,13 +224,13 @@ def write_trj(
                 )
                 if xtbfree is not None:
                     xtbfree = f"{xtbfree:20.8f}"
+                ### coordinates in xyz, one write per conformer
                 out.write(
+                    f"  {nat}\n"
                     f"G(CENSO)= {getattr(conf, attribute):20.8f}"
                     f"  G(xTB)= {xtbfree}"
-                    f"        !CONF{str(conf.id)}\n"
+                    f"        !CONF{str(conf.id)}\n" + "\n".join(conf_xyz) + "\n"
                 )
-                for line in conf_xyz:
-                    out.write(line + "\n")
     except (FileExistsError, ValueError):
         print(
             f"{'WARNING:':{WARNLEN}}Could not write trajectory: "
@@ -242,18 +240,14 @@ def write_trj(
 
 def check_for_float(line):
     """ Go through line and check for float, return first float"""
-    elements = line.strip().split()
-    value = None
-    for element in elements:
-        try:
-            value = float(element)
-            found = True
-        except ValueError:
-            found = False
-            value = None
-        if found:
-            break
-    return value
+    for element in line.split():
+        # skip words which can not be a float without raising an exception
+        if element[0] in FLOAT_START:
+            try:
+                return float(element)
+            except ValueError:
+                pass
+    return None
 
 
 def last_folders(path, number=1):
@@ -281,18 +275,22 @@ def get_energy_from_ensemble(path, config, conformers):
     Get energies from the ensemble inputfile and assign xtb_energy and
     rel_xtb_energy
     """
+    conformers.sort(key=lambda x: int(x.id))
+    # line index of the comment line --> conformer id, only these are parsed
+    needed = {(conf.id - 1) * (config.nat + 2) + 1: conf.id for conf in conformers}
+    e = {conf.id: None for conf in conformers}
+    nlines = 0
     with open(path, "r", encoding=CODING, newline=None) as inp:
-        data = inp.readlines()
-    if config.maxconf * (config.nat + 2) > len(data):
+        for nlines, line in enumerate(inp, 1):
+            conf_id = needed.get(nlines - 1)
+            if conf_id is not None:
+                e[conf_id] = check_for_float(line)
+    if config.maxconf * (config.nat + 2) > nlines:
         print(
             f"{'ERROR:':{WARNLEN}}Either the number of conformers ({config.nconf}) "
             f"or the number of atoms ({config.nat}) is wrong!"
         )
     # calc energy and rel energy:
-    e = {}
-    conformers.sort(key=lambda x: int(x.id))
-    for conf in conformers:
-        e[conf.id] = check_for_float(data[(conf.id - 1) * (config.nat + 2) + 1])
     try:
         lowest = float(min([i for i in e.values() if i is not None]))
     except (ValueError, TypeError):
@@ -311,6 +309,14 @@ def get_energy_from_ensemble(path, config, conformers):
     return conformers
 
 
+def _write_file(path, content):
+    """
+    Write content to file path (used for concurrent writes)
+    """
+    with open(path, "w", newline=None) as out:
+        out.write(content)
+
+
 def ensemble2coord(config, foldername, conflist, store_confs, save_errors):
     """
     read ensemble file: e.g. 'crest_conformers.xyz' and write coord files into
@@ -334,72 +340,65 @@ def ensemble2coord(config, foldername, conflist, store_confs, save_errors):
             f"ERROR: Either the number of conformers ({config.nconf}) "
             f"or the number of atoms ({config.nat}) is wrong!"
         )
+    jobs = []  # (outpath, content of coord file)
     for conf in conflist:
+        outpath = os.path.join(config.cwd, "CONF" + str(conf.id), foldername, "coord")
+        if os.path.isfile(outpath):
+            continue
         i = conf.id
-        atom = []
-        x = []
-        y = []
-        z = []
         start = (i - 1) * (config.nat + 2) + 2
         end = i * (config.nat + 2)
-        for line in data[start:end]:
-            atom.append(str(line.split()[0].lower()))
-            x.append(float(line.split()[1]) / BOHR2ANG)
-            y.append(float(line.split()[2]) / BOHR2ANG)
-            z.append(float(line.split()[3]) / BOHR2ANG)
         coordxyz = []
-        for j in range(len(x)):
-            coordxyz.append(f"{x[j]: .14f} {y[j]: .14f}  {z[j]: .14f}  {atom[j]}")
-        outpath = os.path.join(config.cwd, "CONF" + str(conf.id), foldername, "coord")
-        if not os.path.isfile(outpath):
-            # print(f"Write new coord file in {last_folders(outpath)}")
-            with open(outpath, "w", newline=None) as coord:
-                coord.write("$coord\n")
-                for line in coordxyz:
-                    coord.write(line + "\n")
-                coord.write("$end")
+        for line in data[start:end]:
+            atom, x, y, z = line.split(None, 4)[:4]
+            coordxyz.append(
+                COORD_LINE
+                % (
+                    float(x) / BOHR2ANG,
+                    float(y) / BOHR2ANG,
+                    float(z) / BOHR2ANG,
+                    atom.lower(),
+                )
+            )
+        # print(f"Write new coord file in {last_folders(outpath)}")
+        jobs.append((outpath, "$coord\n" + "\n".join(coordxyz) + "\n$end"))
+    # many small files in different folders, write them concurrently
+    with ThreadPoolExecutor(max_workers=min(16, len(jobs)) or 1) as executor:
+        futures = [executor.submit(_write_file, *job) for job in jobs]
+    for future in futures:
+        future.result()  # raise errors of the writes
     return conflist, store_confs, save_errors
 
 
-def splitting(item):
-    """
-    Used in move_recursively.
-
-    """
-    try:
-        return int(item.rsplit(".", 1)[1])
-    except ValueError:
-        return 0
-
-
 def move_recursively(path, filename):
     """
     Check if file or file.x exists and move them to file.x+1 ignores e.g.
     file.save
     """
-    files = [
-        f for f in os.listdir(path) if os.path.isfile(os.path.join(path, f))
-    ]  # list of all files in directory
-    newfiles = []  # list of all files in directory that contain filename and '.'
-    for item in files:
-        if filename + "." in item:
-            newfiles.append(item)
-    newfiles.sort(key=splitting, reverse=True)
-    for item in newfiles:
-        try:
-            data = item.rsplit(".", 1)  # splits only at last '.'
-            int(data[1])
-        except ValueError:
-            continue
-        tmp_from = os.path.join(path, item)
-        newfilename = str(data[0]) + "." + str(int(data[1]) + 1)
-        tmp_to = os.path.join(path, newfilename)
-        # print("Backing up {} to {}.".format(item, newfilename))
-        shutil.move(tmp_from, tmp_to)
+    backups = []  # (x, name) of all files named exactly filename.x
+    found = False
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if not entry.is_file():
+                continue
+            if entry.name == filename:
+                found = True
+                continue
+            head, _, suffix = entry.name.rpartition(".")
+            if head == filename and suffix.isdecimal():
+                backups.append((int(suffix), entry.name))
+    # highest number first, so that no backup is overwritten
+    backups.sort(reverse=True)
+    for number, item in backups:
+        # print("Backing up {} to {}.".format(item, filename + "." + str(number + 1)))
+        os.rename(
+            os.path.join(path, item),
+            os.path.join(path, filename + "." + str(number + 1)),
+        )
 
-    if filename in files:
+    if found:
         print("Backing up {} to {}.".format(filename, filename + ".1"))
-        shutil.move(os.path.join(path, filename), os.path.join(path, filename + ".1"))
+        os.rename(os.path.join(path, filename), os.path.join(path, filename + ".1"))
 
 
 def calc_boltzmannweights(confs, property, T):
@@ -433,30 +432,46 @@ def calc_boltzmannweights(confs, property, T):
         )
     except ValueError:
         print(f"{'ERROR:':{WARNLEN}}Boltzmann weight can not be calculated!")
-    bsum = 0.0
-    for item in confs:
-        bsum += getattr(item, "gi", 1.0) * math.exp(
-            -((item.free_energy - minfree) * AU2J) / (KB * T)
-        )
-    for item in confs:
-        item.bm_weight = (
-            getattr(item, "gi", 1.0)
-            * math.exp(-((item.free_energy - minfree) * AU2J) / (KB * T))
-            / bsum
-        )
+    # evaluate every exponential only once
+    factor = AU2J / (KB * T)
+    weights = [
+        getattr(item, "gi", 1.0)
+        * math.exp(-(getattr(item, property) - minfree) * factor)
+        for item in confs
+    ]
+    bsum = math.fsum(weights)
+    for item, weight in zip(confs, weights):
+        item.bm_weight = weight / bsum
     return confs
 
 
-def new_folders(cwd, conflist, foldername, save_errors, store_confs, silent=False):
-    """ 
-    create folders for all conformers in conflist
+def new_folders(
+    cwd, conflist, foldername, save_errors, store_confs, silent=False, threads=1
+):
+    """
+    create folders for all conformers in conflist, with threads > 1 the folders
+    are created by a thread pool (only worthwhile on slow network filesystems)
     """
 
-    for conf in conflist:
-        tmp_dir = os.path.join(cwd, "CONF" + str(conf.id), foldername)
+    def mkdir_error(tmp_dir):
+        """create tmp_dir and return the exception if it fails"""
         try:
             mkdir_p(tmp_dir)
         except Exception as e:
+            return e
+        return None
+
+    tmp_dirs = [
+        os.path.join(cwd, "CONF" + str(conf.id), foldername) for conf in conflist
+    ]
+    if threads > 1 and len(tmp_dirs) > 1:
+        with ThreadPoolExecutor(max_workers=min(threads, len(tmp_dirs))) as executor:
+            errors = list(executor.map(mkdir_error, tmp_dirs))
+    else:
+        errors = [mkdir_error(tmp_dir) for tmp_dir in tmp_dirs]
+    keep = []
+    for conf, tmp_dir, e in zip(conflist, tmp_dirs, errors):
+        if e is not None:
             print(e)
             if not os.path.isdir(tmp_dir):
                 print(f"{'ERROR:':{WARNLEN}}Could not create folder for CONF{conf.id}!")
@@ -466,7 +481,10 @@ def new_folders(cwd, conflist, foldername, save_errors, store_confs, silent=Fals
                 save_errors.append(
                     f"{'ERROR:':{WARNLEN}}CONF{conf.id} was removed, because IO failed!"
                 )
-                store_confs.append(conflist.pop(conflist.index(conf)))
+                store_confs.append(conf)
+                continue
+        keep.append(conf)
+    conflist[:] = keep
     if not silent:
         print("Constructed folders!")
     return save_errors, store_confs, conflist
@@ -495,10 +513,13 @@ def do_md5(path):
     Calculate md5 of file to identifly if restart happend on the same file!
     Input is buffered into smaller sizes to ease on memory consumption.
     """
-    BUF_SIZE = 65536
+    BUF_SIZE = 1048576
     md5 = hashlib.md5()
     if os.path.isfile(path):
         with open(path, "rb") as f:
+            if hasattr(hashlib, "file_digest"):
+                # python >= 3.11, read and update loop runs in C
+                return hashlib.file_digest(f, "md5").hexdigest()
             while True:
                 data = f.read(BUF_SIZE)
                 if not data:
@@ -547,13 +568,12 @@ def pearson(A, B):
     n = float(len(A))
     muA = sum(A) / n
     muB = sum(B) / n
-    diffA = map(lambda x: x - muA, A)
-    diffB = map(lambda x: x - muB, B)
-    stdA = math.sqrt((1 / (n - 1)) * sum([d * d for d in diffA]))
-    stdB = math.sqrt((1 / (n - 1)) * sum([d * d for d in diffB]))
+    diffA = [a - muA for a in A]
+    diffB = [b - muB for b in B]
     try:
-        return (sum([A[i] * B[i] for i in range(int(n))]) - n * muA * muB) / (
-            (n - 1) * stdA * stdB
+        # covariance / (stdA * stdB), the (n-1) normalizations cancel
+        return sum(a * b for a, b in zip(diffA, diffB)) / math.sqrt(
+            sum(d * d for d in diffA) * sum(d * d for d in diffB)
         )
     except ZeroDivisionError as e:
         print(f"{'WARNING:':{WARNLEN}}{e}")
@@ -606,38 +626,25 @@ def printout(
         ):
             columndescription2[i] = "[" + str(columndescription[i]).split("[")[1]
             columndescription[i] = str(columndescription[i]).split("[")[0]
+    # evaluate every column call only once per conformer
+    values = [[call(conf) for conf in calculate] for call in columncall]
     try:
         for j in range(len(columncall)):
             if columnformat[j]:
                 collength.append(
                     max(
-                        [
-                            len(str(f"{i:{columnformat[j][0]}.{columnformat[j][1]}f}"))
-                            for i in map(columncall[j], calculate)
-                        ]
+                        len(f"{i:{columnformat[j][0]}.{columnformat[j][1]}f}")
+                        for i in values[j]
                     )
                 )
             else:
-                collength.append(max([len(i) for i in map(columncall[j], calculate)]))
-            if (
-                max(
-                    len(i)
-                    for i in [
-                        columndescription[j],
-                        columnheader[j],
-                        columndescription2[j],
-                    ]
-                )
-                > collength[j]
-            ):
-                collength[j] = max(
-                    len(i)
-                    for i in [
-                        columndescription[j],
-                        columnheader[j],
-                        columndescription2[j],
-                    ]
-                )
+                collength.append(max(len(i) for i in values[j]))
+            collength[j] = max(
+                collength[j],
+                len(columndescription[j]),
+                len(columnheader[j]),
+                len(columndescription2[j]),
+            )
     except (ValueError, TypeError) as e:
         print(f"\n\nERRROR {e}")
         for j in range(len(columncall)):
@@ -659,15 +666,15 @@ def printout(
             line = " ".join(columndescriptionprint2)
             print(line)
             out.write(line + "\n")
-        for conf in calculate:
+        for k, conf in enumerate(calculate):
             columncallprint = []
             for i in range(len(columncall)):
                 if columnformat[i]:
                     columncallprint.append(
-                        f"{columncall[i](conf):{collength[i]}.{columnformat[i][1]}f}"
+                        f"{values[i][k]:{collength[i]}.{columnformat[i][1]}f}"
                     )
                 else:
-                    columncallprint.append(f"{columncall[i](conf):{collength[i]}}")
+                    columncallprint.append(f"{values[i][k]:{collength[i]}}")
             if conf.free_energy != minfree:
                 line = " ".join(columncallprint)
                 print(line)
@@ -702,8 +709,8 @@ def crest_routine(config, conformers, func, store_confs, prev_calculated=None):
     if os.path.isfile(os.path.join(config.cwd, dirn, "coord")):
         os.remove(os.path.join(config.cwd, dirn, "coord"))
 
-    allconfs = deepcopy(conformers)
-    allconfs.extend(deepcopy(prev_calculated))
+    # only read access (id and energy) below, a shallow copy is sufficient
+    allconfs = list(conformers) + list(prev_calculated)
 
     ### sort conformers according to energy of optimization
     allconfs.sort(key=lambda conf: float(getattr(conf, "optimization_info")["energy"]))
@@ -718,29 +725,24 @@ def crest_routine(config, conformers, func, store_confs, prev_calculated=None):
 
     # write conformers.xyz file
     with open(
-        os.path.join(config.cwd, dirn, fn), "w", encoding=CODING, newline=None
+        os.path.join(config.cwd, dirn, fn),
+        "w",
+        encoding=CODING,
+        newline=None,
+        buffering=1048576,
     ) as out:
         for conf in allconfs:
             conf_xyz, nat = t2x(os.path.join(config.cwd, "CONF" + str(conf.id), func))
-            out.write("  {}\n".format(nat))  ### number of atoms
+            ### number of atoms, energy and coordinates in one write
             out.write(
-                "{:20.8f}        !{}\n".format(
+                "  {}\n{:20.8f}        !{}\n".format(
+                    nat,
                     getattr(conf, "optimization_info")["energy"], "CONF" + str(conf.id)
                     #getattr(conf, "lowlevel_sp_info")["energy"], "CONF" + str(conf.id)
                 )
+                + "\n".join(conf_xyz)
+                + "\n"
             )
-            for line in conf_xyz:
-                out.write(line + "\n")
-        # for conf in allconfs:
-        #     conf_xyz, nat = t2x(os.path.join(config.cwd, "CONF" + str(conf.id), func))
-        #     out.write("  {}\n".format(nat))  ### number of atoms
-        #     out.write(
-        #         "{:20.8f}        !{}\n".format(
-        #             getattr(conf, "optimization_info")["energy"], "CONF" + str(conf.id)
-        #         )
-        #     )
-        #     for line in conf_xyz:
-        #         out.write(line + "\n")
     time.sleep(0.01)
 
     crestcall = [
@@ -784,29 +786,23 @@ def crest_routine(config, conformers, func, store_confs, prev_calculated=None):
             print(
                 f"{'ERROR:':{WARNLEN}}output file (enso.tags) of CREST routine does not exist!"
             )
-        keep = []
     if config.crestcheck:
         try:
-            for line in store:
-                keep.append(line.split()[1][1:])
-            for conf in list(conformers):
-                if "CONF" + str(conf.id) not in keep:
-                    conf.optimization_info["info"] = "calculated"
-                    conf.optimization_info["cregen_sort"] = "removed"
-                    print(
-                        f"!!!! Removing CONF{conf.id} because it is sorted "
-                        "out by CREGEN."
-                    )
-                    store_confs.append(conformers.pop(conformers.index(conf)))
-            for conf in list(prev_calculated):
-                if "CONF" + str(conf.id) not in keep:
+            keep = {line.split()[1][1:] for line in store}
+            for conflist in (conformers, prev_calculated):
+                kept = []
+                for conf in conflist:
+                    if "CONF" + str(conf.id) in keep:
+                        kept.append(conf)
+                        continue
                     conf.optimization_info["info"] = "calculated"
                     conf.optimization_info["cregen_sort"] = "removed"
                     print(
                         f"!!!! Removing CONF{conf.id} because it is sorted "
                         "out by CREGEN."
                     )
-                    store_confs.append(prev_calculated.pop(prev_calculated.index(conf)))
+                    store_confs.append(conf)
+                conflist[:] = kept
         except (NameError, Exception) as e:
             print(f"{'ERROR:':{WARNLEN}}{e}")
     return conformers, prev_calculated, store_confs
@@ -877,7 +873,7 @@ def calc_std_dev(data):
     n = len(data)
     if len(data) != 0:
         mean = sum(data) / n
-        variance = sum([(x - mean) ** 2 for x in data]) / (n - 1)
+        variance = sum((x - mean) ** 2 for x in data) / (n - 1)
         std_dev = math.sqrt(variance)
     else:
         std_dev = 0.0
@@ -895,13 +891,11 @@ def calc_weighted_std_dev(data, weights=None):
         return 0.0
     if not weights or len(weights) < n:
         weights = [1.0 for _ in range(n)]
-    w_mean = sum([data[i] * weights[i] for i in range(n)]) / sum(weights)
-    m = 0
-    for i in weights:
-        if i != 0.0:
-            m += 1
-    variance = sum([weights[i] * (data[i] - w_mean) ** 2 for i in range(n)]) / (
-        (m - 1) * sum(weights) / m
+    w_sum = sum(weights)
+    w_mean = sum(x * w for x, w in zip(data, weights)) / w_sum
+    m = sum(1 for w in weights if w != 0.0)
+    variance = sum(w * (x - w_mean) ** 2 for x, w in zip(data, weights)) / (
+        (m - 1) * w_sum / m
     )
     std_dev = math.sqrt(variance)
     return std_dev
@@ -919,8 +913,8 @@ def print_errors(line, save_errors):
 def conf_in_interval(conformers, full_free_energy=True, bm=True):
     """ number of conformers (and Boltzmann weights) within free energy window intervals """
     basins = {}
-    max_rel_free = max([getattr(conf, "rel_free_energy") for conf in conformers])
-    len_confx = max([len(str(conf.id)) for conf in conformers]) + 1
+    max_rel_free = max(conf.rel_free_energy for conf in conformers)
+    len_confx = max(len(str(conf.id)) for conf in conformers) + 1
     for i in frange(0.5, 6.0, 0.5):
         if i <= max_rel_free + 0.5:
             basins[i] = {"nconf": 0, "bmweight": 0.0}